@@ -1,5 +1,5 @@
 # backend/app/core/database.py
-from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, Enum, ForeignKey, Text, JSON
+from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, Enum, ForeignKey, Text, JSON, Index, DDL, text, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship, sessionmaker
 from datetime import datetime
@@ -52,6 +52,7 @@ class WaterBody(Base):
     
     # Relationships
     satellite_data = relationship("SatelliteData", back_populates="water_body")
+    latest_observation = relationship("LatestObservation", back_populates="water_body", uselist=False)
     alerts = relationship("Alert", back_populates="water_body")
     restoration_projects = relationship("RestorationProject", back_populates="water_body")
     
@@ -62,10 +63,16 @@ class WaterBody(Base):
 
 class SatelliteData(Base):
     __tablename__ = "satellite_data"
+    __table_args__ = (
+        # Per-body range scans: WHERE water_body_id = ? AND capture_date BETWEEN ...
+        Index("ix_satellite_data_body_date", "water_body_id", "capture_date"),
+        # Range-partitioned by capture_date; partition key must be part of the PK
+        {"postgresql_partition_by": "RANGE (capture_date)"},
+    )
     
-    id = Column(Integer, primary_key=True)
-    water_body_id = Column(String, ForeignKey("water_bodies.id"))
-    capture_date = Column(DateTime)
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    water_body_id = Column(String, ForeignKey("water_bodies.id"), nullable=False)
+    capture_date = Column(DateTime, primary_key=True)
     image_url = Column(String)
     cloud_cover_percentage = Column(Float)
     resolution_m = Column(Float)
@@ -84,6 +91,165 @@ class SatelliteData(Base):
     
     water_body = relationship("WaterBody", back_populates="satellite_data")
 
+# satellite_data is split into one partition per calendar year of
+# capture_date. Partitions from the start of Landsat-8 history (Sentinel-2
+# follows in 2015) through next year are created with the table; later or
+# earlier years are created on demand by ensure_satellite_partition()
+# (ObservationService does this on ingest). There is deliberately no
+# DEFAULT partition: an insert for a year without a partition fails
+# instead of silently bypassing pruning.
+SATELLITE_HISTORY_START_YEAR = 2013
+
+def satellite_partition_name(year: int) -> str:
+    return f"satellite_data_{year}"
+
+def satellite_partition_ddl(year: int) -> DDL:
+    return DDL(
+        f"CREATE TABLE IF NOT EXISTS {satellite_partition_name(year)} "
+        f"PARTITION OF satellite_data "
+        f"FOR VALUES FROM ('{year}-01-01') TO ('{year + 1}-01-01')"
+    )
+
+def _satellite_partition_exists(connection, year: int) -> bool:
+    return connection.execute(
+        text("SELECT to_regclass(:name)"), {"name": satellite_partition_name(year)}
+    ).scalar() is not None
+
+def ensure_satellite_partition(connection, year: int):
+    """Create the partition holding one calendar year of satellite_data if missing"""
+    if _satellite_partition_exists(connection, year):
+        return
+    # Serialise creators: CREATE TABLE IF NOT EXISTS checks before it waits on
+    # the parent table lock, so two workers racing on a new year would
+    # otherwise fail with a duplicate relation. Held until the transaction ends.
+    connection.execute(text("SELECT pg_advisory_xact_lock(hashtext('satellite_data_partitions'))"))
+    if not _satellite_partition_exists(connection, year):
+        connection.execute(satellite_partition_ddl(year))
+
+# latest_observations is maintained inside the database so that every
+# writer of satellite_data keeps it current, not only ObservationService.
+# Inserts upsert conditionally, so backfilled (older) captures never
+# overwrite a newer snapshot row; updates and deletes recompute the body.
+SNAPSHOT_COLUMNS = (
+    "capture_date",
+    "ndwi_score",
+    "water_spread_hectares",
+    "change_type",
+    "cloud_cover_percentage",
+    "source",
+)
+
+SNAPSHOT_UPSERT_SET = ", ".join(
+    ["satellite_data_id = EXCLUDED.satellite_data_id"]
+    + [f"{c} = EXCLUDED.{c}" for c in SNAPSHOT_COLUMNS]
+    + ["updated_at = EXCLUDED.updated_at"]
+)
+
+SNAPSHOT_RECOMPUTE_DDL = DDL(f"""
+CREATE OR REPLACE FUNCTION recompute_latest_observation(body_id varchar) RETURNS void AS $$
+DECLARE
+    latest record;
+BEGIN
+    -- Served by ix_satellite_data_body_date
+    SELECT * INTO latest FROM satellite_data
+    WHERE water_body_id = body_id
+    ORDER BY capture_date DESC, id DESC
+    LIMIT 1;
+
+    IF NOT FOUND THEN
+        DELETE FROM latest_observations WHERE water_body_id = body_id;
+        RETURN;
+    END IF;
+
+    INSERT INTO latest_observations
+        (water_body_id, satellite_data_id, {", ".join(SNAPSHOT_COLUMNS)}, updated_at)
+    VALUES
+        (body_id, latest.id, {", ".join("latest." + c for c in SNAPSHOT_COLUMNS)},
+         timezone('utc', now()))
+    ON CONFLICT (water_body_id) DO UPDATE SET {SNAPSHOT_UPSERT_SET};
+END;
+$$ LANGUAGE plpgsql
+""")
+
+SNAPSHOT_FUNCTION_DDL = DDL(f"""
+CREATE OR REPLACE FUNCTION refresh_latest_observation() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO latest_observations
+            (water_body_id, satellite_data_id, {", ".join(SNAPSHOT_COLUMNS)}, updated_at)
+        VALUES
+            (NEW.water_body_id, NEW.id, {", ".join("NEW." + c for c in SNAPSHOT_COLUMNS)},
+             timezone('utc', now()))
+        ON CONFLICT (water_body_id) DO UPDATE SET {SNAPSHOT_UPSERT_SET}
+        WHERE latest_observations.capture_date <= EXCLUDED.capture_date;
+        RETURN NULL;
+    END IF;
+
+    -- An edited or removed row may have been the latest: look the body up again
+    PERFORM recompute_latest_observation(OLD.water_body_id);
+    IF TG_OP = 'UPDATE' AND NEW.water_body_id IS DISTINCT FROM OLD.water_body_id THEN
+        PERFORM recompute_latest_observation(NEW.water_body_id);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+""")
+
+def install_snapshot_trigger(connection):
+    """(Re)create the trigger that keeps latest_observations current"""
+    connection.execute(SNAPSHOT_RECOMPUTE_DDL)
+    connection.execute(SNAPSHOT_FUNCTION_DDL)
+    connection.execute(DDL("DROP TRIGGER IF EXISTS satellite_data_refresh_latest ON satellite_data"))
+    connection.execute(DDL(
+        "CREATE TRIGGER satellite_data_refresh_latest "
+        "AFTER INSERT OR UPDATE OR DELETE ON satellite_data "
+        "FOR EACH ROW EXECUTE FUNCTION refresh_latest_observation()"
+    ))
+
+def rebuild_latest_observations(connection) -> int:
+    """Repopulate latest_observations from satellite_data in one statement"""
+    result = connection.execute(text(f"""
+        INSERT INTO latest_observations
+            (water_body_id, satellite_data_id, {", ".join(SNAPSHOT_COLUMNS)}, updated_at)
+        SELECT DISTINCT ON (water_body_id)
+            water_body_id, id, {", ".join(SNAPSHOT_COLUMNS)}, timezone('utc', now())
+        FROM satellite_data
+        ORDER BY water_body_id, capture_date DESC, id DESC
+        ON CONFLICT (water_body_id) DO UPDATE SET {SNAPSHOT_UPSERT_SET}
+        WHERE latest_observations.capture_date <= EXCLUDED.capture_date
+    """))
+    return result.rowcount
+
+@event.listens_for(SatelliteData.__table__, "after_create")
+def _setup_satellite_data(target, connection, **kw):
+    if connection.dialect.name != "postgresql":
+        return
+    for year in range(SATELLITE_HISTORY_START_YEAR, datetime.utcnow().year + 2):
+        ensure_satellite_partition(connection, year)
+    install_snapshot_trigger(connection)
+
+class LatestObservation(Base):
+    """Most recent satellite observation per water body.
+    
+    One row per body, maintained by the satellite_data_refresh_latest trigger
+    on every insert, update and delete, so dashboard/map reads never scan
+    satellite_data history.
+    """
+    __tablename__ = "latest_observations"
+    
+    water_body_id = Column(String, ForeignKey("water_bodies.id"), primary_key=True)
+    satellite_data_id = Column(Integer)
+    capture_date = Column(DateTime, nullable=False)
+    
+    ndwi_score = Column(Float)
+    water_spread_hectares = Column(Float)
+    change_type = Column(String)
+    cloud_cover_percentage = Column(Float)
+    source = Column(String)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    water_body = relationship("WaterBody", back_populates="latest_observation")
+
 class Alert(Base):
     __tablename__ = "alerts"
     
@@ -9,7 +9,8 @@ from app.core.database import SessionLocal, engine, Base
 from app.api import water_bodies, satellite, ml, analysis
 from app.services.gee_service import GEEService
 
-# Create tables
+# Create tables (existing databases: run scripts/upgrade_satellite_data.py,
+# create_all does not alter tables that already exist)
 Base.metadata.create_all(bind=engine)
 
 app = FastAPI(
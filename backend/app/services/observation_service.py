@@ -0,0 +1,71 @@
+# backend/app/services/observation_service.py
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.database import SatelliteData, LatestObservation, ensure_satellite_partition, rebuild_latest_observations
+
+class ObservationService:
+    """Write path for satellite_data.
+
+    Inserts must make sure the capture year's partition exists first;
+    latest_observations is then kept current by a database trigger.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def ingest(self, water_body_id: str, capture_date: datetime, **fields) -> SatelliteData:
+        """Store a satellite observation; the trigger refreshes the body's snapshot"""
+
+        ensure_satellite_partition(self.db.connection(), capture_date.year)
+        record = SatelliteData(water_body_id=water_body_id, capture_date=capture_date, **fields)
+        self.db.add(record)
+        self.db.commit()
+        return record
+
+    def ingest_many(self, observations: List[Dict]) -> int:
+        """Bulk ingest; the snapshot only moves forward to the newest capture per body"""
+
+        records = [SatelliteData(**obs) for obs in observations]
+        for year in {record.capture_date.year for record in records}:
+            ensure_satellite_partition(self.db.connection(), year)
+        self.db.add_all(records)
+        self.db.commit()
+        return len(records)
+
+    def get_latest(self, water_body_id: str) -> Optional[LatestObservation]:
+        return self.db.get(LatestObservation, water_body_id)
+
+    def get_all_latest(self, water_body_ids: Optional[List[str]] = None) -> List[LatestObservation]:
+        """Latest state for every body (or a subset) straight from the snapshot table"""
+
+        query = select(LatestObservation)
+        if water_body_ids is not None:
+            query = query.where(LatestObservation.water_body_id.in_(water_body_ids))
+        return list(self.db.scalars(query))
+
+    def get_history(
+        self,
+        water_body_id: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> List[SatelliteData]:
+        """Per-body range scan; served by ix_satellite_data_body_date and
+        pruned to the matching capture_date partitions"""
+
+        query = select(SatelliteData).where(SatelliteData.water_body_id == water_body_id)
+        if start_date:
+            query = query.where(SatelliteData.capture_date >= start_date)
+        if end_date:
+            query = query.where(SatelliteData.capture_date < end_date)
+        return list(self.db.scalars(query.order_by(SatelliteData.capture_date)))
+
+    def rebuild_snapshot(self) -> int:
+        """Repopulate latest_observations from full history (backfill/repair)"""
+
+        count = rebuild_latest_observations(self.db.connection())
+        self.db.commit()
+        return count
@@ -0,0 +1,115 @@
+# backend/scripts/upgrade_satellite_data.py
+"""Upgrade an existing database to the partitioned satellite_data layout.
+
+Base.metadata.create_all() skips tables that already exist, so databases
+created before satellite_data was partitioned keep the old unpartitioned
+table, without ix_satellite_data_body_date or the snapshot trigger, and
+with an empty latest_observations. This script:
+
+1. renames the old table to satellite_data_legacy,
+2. creates the partitioned satellite_data (index + trigger) and
+   latest_observations,
+3. creates a partition for every capture year found and copies the rows,
+4. rebuilds latest_observations in one statement.
+
+Everything runs in a single transaction and is safe to re-run. The legacy
+table is kept for verification; drop it by hand afterwards.
+
+Usage (from backend/):
+    python -m scripts.upgrade_satellite_data
+"""
+from sqlalchemy import text
+
+from app.core.database import (
+    Base,
+    engine,
+    ensure_satellite_partition,
+    install_snapshot_trigger,
+    rebuild_latest_observations,
+)
+
+LEGACY_TABLE = "satellite_data_legacy"
+
+COPY_COLUMNS = (
+    "id, water_body_id, capture_date, image_url, cloud_cover_percentage, "
+    "resolution_m, ndwi_score, water_spread_hectares, vegetation_index, "
+    "change_from_previous, change_type, source, processed_at"
+)
+
+def _relkind(connection, table: str):
+    return connection.execute(
+        text("SELECT relkind FROM pg_class WHERE oid = to_regclass(:name)"),
+        {"name": table}
+    ).scalar()
+
+def _detach_legacy_table(connection):
+    """Move the unpartitioned table out of the way, freeing its names"""
+    connection.execute(text(f"ALTER TABLE satellite_data RENAME TO {LEGACY_TABLE}"))
+    connection.execute(text(
+        f"ALTER TABLE {LEGACY_TABLE} RENAME CONSTRAINT satellite_data_pkey TO {LEGACY_TABLE}_pkey"
+    ))
+    connection.execute(text(
+        f"ALTER SEQUENCE IF EXISTS satellite_data_id_seq RENAME TO {LEGACY_TABLE}_id_seq"
+    ))
+
+def _copy_legacy_rows(connection) -> dict:
+    years = connection.execute(text(
+        f"SELECT DISTINCT extract(year FROM capture_date)::int FROM {LEGACY_TABLE} "
+        f"WHERE capture_date IS NOT NULL"
+    )).scalars().all()
+    for year in years:
+        ensure_satellite_partition(connection, year)
+
+    # Bulk copy without the per-row trigger; the snapshot is rebuilt once afterwards
+    connection.execute(text("DROP TRIGGER IF EXISTS satellite_data_refresh_latest ON satellite_data"))
+    copied = connection.execute(text(
+        f"INSERT INTO satellite_data ({COPY_COLUMNS}) "
+        f"SELECT {COPY_COLUMNS} FROM {LEGACY_TABLE} "
+        f"WHERE water_body_id IS NOT NULL AND capture_date IS NOT NULL"
+    )).rowcount
+    install_snapshot_trigger(connection)
+
+    connection.execute(text(
+        "SELECT setval(pg_get_serial_sequence('satellite_data', 'id'), "
+        "COALESCE((SELECT max(id) FROM satellite_data), 0) + 1, false)"
+    ))
+
+    skipped = connection.execute(text(
+        f"SELECT count(*) FROM {LEGACY_TABLE} "
+        f"WHERE water_body_id IS NULL OR capture_date IS NULL"
+    )).scalar()
+    return {"copied": copied, "skipped": skipped, "partitions": len(years)}
+
+def upgrade(connection) -> dict:
+    """Bring satellite_data / latest_observations up to date; returns a summary"""
+
+    summary = {"migrated": False}
+    if _relkind(connection, "satellite_data") == "r":
+        if _relkind(connection, LEGACY_TABLE) is not None:
+            raise Exception(f"{LEGACY_TABLE} already exists; drop it before re-running the upgrade")
+        _detach_legacy_table(connection)
+        summary["migrated"] = True
+
+    Base.metadata.create_all(bind=connection)
+
+    if summary["migrated"]:
+        summary.update(_copy_legacy_rows(connection))
+    else:
+        install_snapshot_trigger(connection)
+
+    summary["snapshot_rows"] = rebuild_latest_observations(connection)
+    return summary
+
+if __name__ == "__main__":
+    with engine.begin() as connection:
+        result = upgrade(connection)
+
+    if result["migrated"]:
+        print(f"Copied {result['copied']} rows into {result['partitions']} yearly partitions")
+        if result["skipped"]:
+            print(f"Skipped {result['skipped']} rows with no water_body_id or capture_date; "
+                  f"they remain in {LEGACY_TABLE}")
+        print(f"Verify, then: DROP TABLE {LEGACY_TABLE}")
+    else:
+        print("satellite_data already partitioned; trigger reinstalled")
+    print(f"latest_observations refreshed for {result['snapshot_rows']} water bodies")
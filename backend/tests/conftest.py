@@ -0,0 +1,38 @@
+# backend/tests/conftest.py
+# These tests need a throwaway PostgreSQL database (partitioning, triggers,
+# ON CONFLICT); every test module wipes its public schema:
+#   cd backend && NEERCHITRA_TEST_DATABASE_URL=postgresql://... python -m pytest tests
+import os
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from app.core.database import Base
+
+TEST_DATABASE_URL = os.environ.get("NEERCHITRA_TEST_DATABASE_URL")
+
+def _reset_schema(engine):
+    with engine.begin() as connection:
+        connection.execute(text("DROP SCHEMA public CASCADE"))
+        connection.execute(text("CREATE SCHEMA public"))
+
+@pytest.fixture(scope="session")
+def pg_engine():
+    if TEST_DATABASE_URL is None:
+        pytest.skip("NEERCHITRA_TEST_DATABASE_URL not set")
+    engine = create_engine(TEST_DATABASE_URL)
+    yield engine
+    engine.dispose()
+
+@pytest.fixture(scope="module")
+def test_engine(pg_engine):
+    """Current schema, created once per module"""
+    _reset_schema(pg_engine)
+    Base.metadata.create_all(bind=pg_engine)
+    yield pg_engine
+
+@pytest.fixture
+def empty_engine(pg_engine):
+    """Empty public schema for each test"""
+    _reset_schema(pg_engine)
+    yield pg_engine
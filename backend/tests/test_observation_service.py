@@ -0,0 +1,161 @@
+# backend/tests/test_observation_service.py
+import threading
+from datetime import datetime
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import sessionmaker
+
+from app.core.database import WaterBody, SatelliteData, ensure_satellite_partition
+from app.services.observation_service import ObservationService
+
+@pytest.fixture
+def db(test_engine):
+    session = sessionmaker(bind=test_engine)()
+    session.add_all([WaterBody(id="WB-TN-001"), WaterBody(id="WB-TN-002")])
+    session.commit()
+    yield session
+    session.rollback()
+    session.execute(text("TRUNCATE satellite_data, latest_observations, water_bodies CASCADE"))
+    session.commit()
+    session.close()
+
+def test_backfilled_capture_does_not_overwrite_newer_snapshot(db):
+    service = ObservationService(db)
+    service.ingest("WB-TN-001", datetime(2024, 6, 1), ndwi_score=0.42, change_type="stable")
+    service.ingest("WB-TN-001", datetime(2021, 1, 15), ndwi_score=-0.10, change_type="drought")
+
+    latest = service.get_latest("WB-TN-001")
+    assert latest.capture_date == datetime(2024, 6, 1)
+    assert latest.ndwi_score == 0.42
+    assert latest.change_type == "stable"
+
+def test_direct_insert_also_refreshes_snapshot(db):
+    db.add(SatelliteData(water_body_id="WB-TN-001", capture_date=datetime(2023, 3, 1), ndwi_score=0.3))
+    db.commit()
+
+    assert ObservationService(db).get_latest("WB-TN-001").ndwi_score == 0.3
+
+def test_reprocessed_latest_row_updates_snapshot(db):
+    service = ObservationService(db)
+    service.ingest("WB-TN-001", datetime(2023, 1, 1), ndwi_score=0.1)
+    latest = service.ingest("WB-TN-001", datetime(2024, 1, 1), ndwi_score=0.2, change_type="stable")
+
+    latest.ndwi_score = 0.25
+    latest.change_type = "encroachment"
+    db.commit()
+
+    snapshot = service.get_latest("WB-TN-001")
+    db.refresh(snapshot)
+    assert snapshot.ndwi_score == 0.25
+    assert snapshot.change_type == "encroachment"
+
+def test_deleting_latest_row_falls_back_to_previous(db):
+    service = ObservationService(db)
+    previous = service.ingest("WB-TN-001", datetime(2023, 1, 1), ndwi_score=0.1)
+    cloudy = service.ingest("WB-TN-001", datetime(2024, 1, 1), ndwi_score=-0.9)
+    only = service.ingest("WB-TN-002", datetime(2024, 1, 1), ndwi_score=0.3)
+
+    db.delete(cloudy)
+    db.delete(only)
+    db.commit()
+
+    snapshot = service.get_latest("WB-TN-001")
+    db.refresh(snapshot)
+    assert snapshot.satellite_data_id == previous.id
+    assert snapshot.ndwi_score == 0.1
+    db.expire_all()
+    assert service.get_latest("WB-TN-002") is None
+
+def test_bulk_ingest_keeps_newest_capture_per_body(db):
+    service = ObservationService(db)
+    count = service.ingest_many([
+        {"water_body_id": "WB-TN-001", "capture_date": datetime(2022, 5, 1), "ndwi_score": 0.20},
+        {"water_body_id": "WB-TN-001", "capture_date": datetime(2024, 2, 1), "ndwi_score": 0.35},
+        {"water_body_id": "WB-TN-001", "capture_date": datetime(2023, 8, 1), "ndwi_score": 0.10},
+        {"water_body_id": "WB-TN-002", "capture_date": datetime(2024, 9, 1), "ndwi_score": 0.50},
+        {"water_body_id": "WB-TN-002", "capture_date": datetime(2020, 1, 1), "ndwi_score": 0.05},
+    ])
+
+    assert count == 5
+    latest = {o.water_body_id: o for o in service.get_all_latest()}
+    assert latest["WB-TN-001"].capture_date == datetime(2024, 2, 1)
+    assert latest["WB-TN-001"].ndwi_score == 0.35
+    assert latest["WB-TN-002"].capture_date == datetime(2024, 9, 1)
+    assert latest["WB-TN-002"].ndwi_score == 0.50
+
+def test_rebuild_snapshot_restores_latest_from_history(db):
+    service = ObservationService(db)
+    service.ingest_many([
+        {"water_body_id": "WB-TN-001", "capture_date": datetime(2021, 1, 1), "ndwi_score": 0.1},
+        {"water_body_id": "WB-TN-001", "capture_date": datetime(2025, 1, 1), "ndwi_score": 0.6},
+    ])
+    db.execute(text("DELETE FROM latest_observations"))
+    db.commit()
+
+    assert service.rebuild_snapshot() == 1
+    assert service.get_latest("WB-TN-001").ndwi_score == 0.6
+
+def test_empty_filter_returns_no_rows(db):
+    service = ObservationService(db)
+    service.ingest("WB-TN-001", datetime(2024, 1, 1), ndwi_score=0.2)
+
+    assert service.get_all_latest([]) == []
+    assert len(service.get_all_latest()) == 1
+
+def test_get_history_respects_bounds_and_order(db):
+    service = ObservationService(db)
+    service.ingest_many([
+        {"water_body_id": "WB-TN-001", "capture_date": datetime(2023, 6, 1), "ndwi_score": 0.3},
+        {"water_body_id": "WB-TN-001", "capture_date": datetime(2021, 6, 1), "ndwi_score": 0.1},
+        {"water_body_id": "WB-TN-001", "capture_date": datetime(2022, 6, 1), "ndwi_score": 0.2},
+        {"water_body_id": "WB-TN-001", "capture_date": datetime(2024, 1, 1), "ndwi_score": 0.4},
+        {"water_body_id": "WB-TN-002", "capture_date": datetime(2022, 7, 1), "ndwi_score": 0.9},
+    ])
+
+    history = service.get_history("WB-TN-001", datetime(2021, 6, 1), datetime(2024, 1, 1))
+
+    # start is inclusive, end exclusive, other bodies excluded
+    assert [r.capture_date for r in history] == [
+        datetime(2021, 6, 1), datetime(2022, 6, 1), datetime(2023, 6, 1)
+    ]
+    assert len(service.get_history("WB-TN-001")) == 4
+
+def test_direct_insert_into_missing_partition_fails(db):
+    db.add(SatelliteData(water_body_id="WB-TN-001", capture_date=datetime(2090, 1, 1)))
+
+    with pytest.raises(IntegrityError, match="no partition"):
+        db.commit()
+
+def test_concurrent_partition_creation_for_new_year(test_engine):
+    first = test_engine.connect()
+    first.begin()
+    ensure_satellite_partition(first, 2040)
+
+    errors = []
+    def second_worker():
+        with test_engine.begin() as second:
+            try:
+                ensure_satellite_partition(second, 2040)
+            except Exception as e:
+                errors.append(e)
+
+    worker = threading.Thread(target=second_worker)
+    worker.start()
+    worker.join(timeout=0.5)
+    assert worker.is_alive()  # waiting on the first creator
+
+    first.commit()
+    first.close()
+    worker.join(timeout=10)
+    assert not worker.is_alive()
+    assert errors == []
+
+def test_dropped_partition_is_recreated_on_ingest(db):
+    db.execute(text("DROP TABLE satellite_data_2014"))
+    db.commit()
+
+    ObservationService(db).ingest("WB-TN-001", datetime(2014, 7, 1), ndwi_score=0.1)
+
+    assert db.execute(text("SELECT count(*) FROM satellite_data_2014")).scalar() == 1
@@ -0,0 +1,108 @@
+# backend/tests/test_upgrade_satellite_data.py
+from datetime import datetime
+
+from sqlalchemy import text
+from sqlalchemy.orm import sessionmaker
+
+from app.core.database import WaterBody
+from app.services.observation_service import ObservationService
+from scripts.upgrade_satellite_data import upgrade
+
+# satellite_data as created by create_all before it was partitioned
+LEGACY_SATELLITE_DATA_DDL = """
+CREATE TABLE satellite_data (
+    id SERIAL NOT NULL,
+    water_body_id VARCHAR,
+    capture_date TIMESTAMP WITHOUT TIME ZONE,
+    image_url VARCHAR,
+    cloud_cover_percentage FLOAT,
+    resolution_m FLOAT,
+    ndwi_score FLOAT,
+    water_spread_hectares FLOAT,
+    vegetation_index FLOAT,
+    change_from_previous FLOAT,
+    change_type VARCHAR,
+    source VARCHAR,
+    processed_at TIMESTAMP WITHOUT TIME ZONE,
+    PRIMARY KEY (id),
+    FOREIGN KEY(water_body_id) REFERENCES water_bodies (id)
+)
+"""
+
+LEGACY_ROWS = [
+    {"id": 1, "water_body_id": "WB-TN-001", "capture_date": datetime(2005, 3, 1), "ndwi_score": 0.05},
+    {"id": 2, "water_body_id": "WB-TN-001", "capture_date": datetime(2023, 3, 1), "ndwi_score": 0.50},
+    {"id": 50, "water_body_id": "WB-TN-001", "capture_date": datetime(2019, 3, 1), "ndwi_score": 0.10},
+    {"id": 4, "water_body_id": "WB-TN-002", "capture_date": datetime(2022, 3, 1), "ndwi_score": 0.20},
+    {"id": 5, "water_body_id": "WB-TN-002", "capture_date": None, "ndwi_score": 0.90},
+]
+
+def _create_legacy_database(engine):
+    with engine.begin() as connection:
+        WaterBody.__table__.create(connection)
+        connection.execute(
+            WaterBody.__table__.insert(), [{"id": "WB-TN-001"}, {"id": "WB-TN-002"}]
+        )
+        connection.execute(text(LEGACY_SATELLITE_DATA_DDL))
+        connection.execute(
+            text(
+                "INSERT INTO satellite_data (id, water_body_id, capture_date, ndwi_score) "
+                "VALUES (:id, :water_body_id, :capture_date, :ndwi_score)"
+            ),
+            LEGACY_ROWS,
+        )
+        connection.execute(text("SELECT setval('satellite_data_id_seq', 50)"))
+
+def _scalar(engine, sql, **params):
+    with engine.connect() as connection:
+        return connection.execute(text(sql), params).scalar()
+
+def test_upgrade_migrates_legacy_table(empty_engine):
+    _create_legacy_database(empty_engine)
+
+    with empty_engine.begin() as connection:
+        summary = upgrade(connection)
+
+    assert summary == {
+        "migrated": True,
+        "copied": 4,
+        "skipped": 1,
+        "partitions": 4,
+        "snapshot_rows": 2,
+    }
+    assert _scalar(empty_engine, "SELECT relkind FROM pg_class WHERE oid = 'satellite_data'::regclass") == "p"
+    for year in (2005, 2019, 2022, 2023):
+        assert _scalar(empty_engine, "SELECT to_regclass(:name)", name=f"satellite_data_{year}") is not None
+    assert _scalar(empty_engine, "SELECT count(*) FROM satellite_data_2005") == 1
+    assert _scalar(empty_engine, "SELECT to_regclass('ix_satellite_data_body_date')") is not None
+    # The legacy table is left in place, untouched
+    assert _scalar(empty_engine, "SELECT count(*) FROM satellite_data_legacy") == 5
+
+    with empty_engine.connect() as connection:
+        latest = connection.execute(text(
+            "SELECT water_body_id, satellite_data_id, ndwi_score "
+            "FROM latest_observations ORDER BY water_body_id"
+        )).all()
+    assert latest == [("WB-TN-001", 2, 0.50), ("WB-TN-002", 4, 0.20)]
+
+    db = sessionmaker(bind=empty_engine)()
+    record = ObservationService(db).ingest("WB-TN-002", datetime(2024, 1, 1), ndwi_score=0.3)
+    assert record.id > 50
+    assert ObservationService(db).get_latest("WB-TN-002").satellite_data_id == record.id
+    db.close()
+
+def test_upgrade_is_idempotent(empty_engine):
+    _create_legacy_database(empty_engine)
+    with empty_engine.begin() as connection:
+        upgrade(connection)
+
+    with empty_engine.begin() as connection:
+        summary = upgrade(connection)
+
+    assert summary == {"migrated": False, "snapshot_rows": 2}
+    assert _scalar(empty_engine, "SELECT count(*) FROM satellite_data") == 4
+    assert _scalar(
+        empty_engine,
+        "SELECT count(*) FROM pg_trigger WHERE tgname = 'satellite_data_refresh_latest' "
+        "AND tgrelid = 'satellite_data'::regclass"
+    ) == 1